@@ -105,6 +105,8 @@ class MatrixDFTExecutor:
         self.Eout_fwd = {}
         self.Ein_rev = {}
         self.Eout_rev = {}
+        # running total of the cache size, updated on insertion and clear
+        self._nbytes = 0
 
     def _key(self, ary, Q, samples, shift):
         """Key to X, Y, U, V dicts."""
@@ -247,6 +249,7 @@ class MatrixDFTExecutor:
             self.Eout_fwd[key] = Eout_fwd
             self.Eout_rev[key] = Eout_rev
             self.Ein_rev[key] = Ein_rev
+            self._nbytes += Ein_fwd.nbytes + Eout_fwd.nbytes + Eout_rev.nbytes + Ein_rev.nbytes
 
     def clear(self):
         """Empty the internal caches to release memory."""
@@ -254,15 +257,11 @@ class MatrixDFTExecutor:
         self.Eout_fwd = {}
         self.Ein_rev = {}
         self.Eout_rev = {}
+        self._nbytes = 0
 
     def nbytes(self):
         """Total size in memory of the cache in bytes."""
-        total = 0
-        for dict_ in (self.Ein_fwd, self.Eout_fwd, self.Ein_rev, self.Eout_rev):
-            for key in dict_:
-                total += dict_[key].nbytes
-
-        return total
+        return self._nbytes
 
 
 mdft = MatrixDFTExecutor()
@@ -3,7 +3,7 @@
 from prysm.mathops import np
 from prysm.coordinates import optimize_xy_separable
 
-from .jacobi import jacobi, jacobi_sequence  # NOQA
+from .jacobi import jacobi, jacobi_sequence, jacobi_sum  # NOQA
 from .cheby import (  # NOQA
     cheby1, cheby1_sequence,
     cheby2, cheby2_sequence,
@@ -30,8 +30,8 @@ from .zernike import (  # NOQA
     top_n,
 )
 from .qpoly import (  # NOQA
-    Qbfs, Qbfs_sequence,
-    Qcon, Qcon_sequence,
+    Qbfs, Qbfs_sequence, Qbfs_sum,
+    Qcon, Qcon_sequence, Qcon_sum,
     Q2d, Q2d_sequence,
 )
 
@@ -141,17 +141,20 @@ def sum_of_xy_modes(modesx, modesy, x, y, weightsx=None, weightsy=None):
     if weightsy is None:
         weightsy = [1]*len(modesy)
 
-    # apply the weights to the modes
-    modesx = [m*w for m, w in zip(modesx, weightsx)]
-    modesy = [m*w for m, w in zip(modesy, weightsy)]
+    # sum the separable bases in 1D; the weighted sum is a single
+    # matrix-vector product, same as sum_of_2d_modes.  The sums are in the
+    # dtype of the grid, so e.g. float32 modes are not promoted by the weights
+    if len(modesx) == 0:
+        sum_x = np.zeros_like(x)
+    else:
+        weightsx = np.asarray(weightsx, dtype=x.dtype)
+        sum_x = np.tensordot(modesx, weightsx, axes=(0, 0)).astype(x.dtype, copy=False)
 
-    # sum the separable bases in 1D
-    sum_x = np.zeros_like(x)
-    sum_y = np.zeros_like(y)
-    for m in modesx:
-        sum_x += m
-    for m in modesy:
-        sum_y += m
+    if len(modesy) == 0:
+        sum_y = np.zeros_like(y)
+    else:
+        weightsy = np.asarray(weightsy, dtype=y.dtype)
+        sum_y = np.tensordot(modesy, weightsy, axes=(0, 0)).astype(y.dtype, copy=False)
 
     # broadcast to 2D and return
     shape = (y.size, x.size)
@@ -181,6 +184,33 @@ def sum_of_2d_modes(modes, weights):
     return np.tensordot(modes, weights, axes=(0, 0))
 
 
+def unique_radii(r):
+    """Unique radii of a grid, and the map from them back to the grid.
+
+    Parameters
+    ----------
+    r : `numpy.ndarray`
+        radial coordinates, of any shape
+
+    Returns
+    -------
+    `numpy.ndarray`, `numpy.ndarray`
+        r_unique, 1D sorted unique values of r, and inverse, an integer array
+        of the same shape as r such that r_unique[inverse] == r
+
+    Notes
+    -----
+    A rotationally symmetric function, e.g. Qbfs_sum or Qcon_sum, evaluated on
+    r_unique and indexed by inverse gives the same result as evaluating it on
+    r.  A square grid has at most about 1/8th as many unique radii as points, so
+    when many surfaces are evaluated on the same grid, computing this once and
+    reusing it makes each evaluation much faster.
+
+    """
+    r_unique, inverse = np.unique(r, return_inverse=True)
+    return r_unique, inverse.reshape(r.shape)
+
+
 def hopkins(a, b, c, r, t, H):
     """Hopkins' aberration expansion.
 
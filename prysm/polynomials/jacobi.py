@@ -1,4 +1,6 @@
 """High performance / recursive jacobi polynomial calculation."""
+import numpy as truenp
+
 from prysm.mathops import np
 
 
@@ -12,12 +14,13 @@ def recurrence_ac_startb(n, alpha, beta):
 
     Also computes partial b term; all components without x
     """
-    a = (2 * n) * (n + alpha + beta) * (2 * n + alpha + beta - 2)
-    c = 2 * (n + alpha - 1) * (n + beta - 1) * (2 * n + alpha + beta)
-    b1 = (2 * n + alpha + beta - 1)
-    b2 = (2 * n + alpha + beta)
-    b2 = b2 * (b2 - 2)
-    b3 = alpha ** 2 - beta ** 2
+    apb = alpha + beta
+    tnpapb = 2 * n + apb
+    a = (2 * n) * (n + apb) * (tnpapb - 2)
+    c = 2 * (n + alpha - 1) * (n + beta - 1) * tnpapb
+    b1 = tnpapb - 1
+    b2 = tnpapb * (tnpapb - 2)
+    b3 = (alpha - beta) * apb  # alpha^2 - beta^2
     return a, c, b1, b2, b3
 
 
@@ -61,11 +64,26 @@ def jacobi(n, alpha, beta, x):
     if n == 2:
         return Pn
 
+    # the recurrence is done in-place; each new term is written over the
+    # storage of the term two orders back, so no temporaries are allocated
+    # inside the loop.  x may be a scalar, asarray gives it storage
+    Pnm1, Pn = np.asarray(Pnm1), np.asarray(Pn)
+    tmp = np.empty_like(Pn)
     for i in range(3, n+1):
         Pnm2, Pnm1 = Pnm1, Pn
         a, c, b1, b2, b3 = recurrence_ac_startb(i, alpha, beta)
         inva = 1 / a
-        Pn = (b1 * (b2 * x + b3) * Pnm1 - c * Pnm2) * inva
+        # Pn = (b1 * (b2 * x + b3) * Pnm1 - c * Pnm2) / a
+        np.multiply(x, b1 * b2 * inva, out=tmp)
+        np.add(tmp, b1 * b3 * inva, out=tmp)
+        np.multiply(tmp, Pnm1, out=tmp)
+        np.multiply(Pnm2, -c * inva, out=Pnm2)
+        np.add(Pnm2, tmp, out=Pnm2)
+        Pn = Pnm2
+
+    # scalar in, scalar out, as for the lower orders
+    if np.ndim(x) == 0:
+        return Pn[()]
 
     return Pn
 
@@ -99,9 +117,8 @@ def jacobi_sequence(ns, alpha, beta, x):
     # ~4x faster than previous impl (118 ms => 29.8)
     ns = list(ns)
     min_i = 0
-    Pn = np.ones_like(x)
     if ns[min_i] == 0:
-        yield Pn
+        yield np.ones_like(x)
         min_i += 1
 
     if min_i == len(ns):
@@ -135,3 +152,108 @@ def jacobi_sequence(ns, alpha, beta, x):
         if ns[min_i] == i:
             yield Pn
             min_i += 1
+
+
+def _trim_zero_orders(cs):
+    """Drop the highest orders of cs whose weights are all zero.
+
+    Parameters
+    ----------
+    cs : `Iterable`
+        weights of shape (N+1,) or (N+1, ...), see jacobi_sum.  A device array
+        (e.g. cupy) is copied to the host with its get method
+
+    Returns
+    -------
+    `numpy.ndarray`, `numpy.ndarray`
+        cs as a host array with the zero orders removed, and a boolean array
+        of shape (len(cs),) that is True for each order with a nonzero weight.
+        At least one order is always kept; empty cs gives a single zero order
+
+    """
+    # the weights are only used on the host, and GPU libraries refuse an
+    # implicit conversion to numpy, so device arrays are copied explicitly
+    if hasattr(cs, 'get'):
+        cs = cs.get()
+
+    cs = truenp.asarray(cs)
+    if cs.shape[0] == 0:
+        cs = truenp.zeros((1,) + cs.shape[1:])
+
+    nonzero = cs.reshape(cs.shape[0], -1).any(axis=1)
+    nonzero_orders = truenp.flatnonzero(nonzero)
+    N = nonzero_orders[-1] if nonzero_orders.size else 0
+    return cs[:N+1], nonzero[:N+1]
+
+
+def jacobi_sum(cs, alpha, beta, x, out=None):
+    """Weighted sum of Jacobi polynomials, using Clenshaw's method.
+
+    Parameters
+    ----------
+    cs : `numpy.ndarray`
+        coefficients, of shape (N+1,) or (N+1, ...); cs[n] is the weight of
+        P_n, for n = 0, 1, 2, ..., N.  Trailing dimensions hold independent
+        sets of coefficients, which are all summed in the same pass.  The
+        weights are used on the host; a device array is copied there once
+    alpha : `float`
+        first weight parameter
+    beta : `float`
+        second weight parameter
+    x : `numpy.ndarray`
+        x coordinates to evaluate at
+    out : `numpy.ndarray`, optional
+        array of shape cs.shape[1:] + x.shape to write the result into
+
+    Returns
+    -------
+    `numpy.ndarray`
+        sum_n cs[n] * P_n^(alpha,beta)(x), of shape cs.shape[1:] + x.shape
+
+    """
+    # with the recurrence written as P_n = (A_n x + B_n) P_n-1 + C_n P_n-2,
+    # Clenshaw's recurrence is
+    # b_k = c_k + (A_k+1 x + B_k+1) b_k+1 + C_k+2 b_k+2
+    # and the sum is c_0 P_0 + b_1 P_1 + C_2 P_0 b_2, with P_0 = 1
+    # orders above the last nonzero weight contribute nothing, and the update
+    # by c_k is skipped for zero weights
+    cs, nonzero = _trim_zero_orders(cs)
+    N = cs.shape[0] - 1
+    x = np.asarray(x)
+
+    # the buffers are floating even when x is an integer array, and complex
+    # for complex weights.  The weights are sent in the same dtype, so float32
+    # grids are not promoted by them
+    dtype = np.result_type(x, 1j if truenp.iscomplexobj(cs) else 1.0)
+
+    # each set of weights broadcasts against x
+    shape = cs.shape[1:] + np.shape(x)
+    cs = np.asarray(cs.reshape(cs.shape + (1,) * np.ndim(x)), dtype=dtype)
+
+    def coefs(n):
+        a, c, b1, b2, b3 = recurrence_ac_startb(n, alpha, beta)
+        inva = 1 / a
+        return b1 * b2 * inva, b1 * b3 * inva, -c * inva
+
+    bkp1 = np.zeros(shape, dtype=dtype)
+    bkp2 = np.zeros(shape, dtype=dtype)
+    # out is only written in the last step, so it may share memory with x
+    tmp = np.empty(shape, dtype=dtype)
+    for k in range(N, 0, -1):
+        A, B, _ = coefs(k+1)
+        _, _, C = coefs(k+2)
+        np.multiply(x, A, out=tmp)
+        np.add(tmp, B, out=tmp)
+        np.multiply(tmp, bkp1, out=tmp)
+        np.multiply(bkp2, C, out=bkp2)
+        np.add(bkp2, tmp, out=bkp2)
+        if nonzero[k]:
+            np.add(bkp2, cs[k], out=bkp2)
+        bkp1, bkp2 = bkp2, bkp1
+
+    P1 = alpha + 1 + (alpha + beta + 2) * ((x - 1) / 2)
+    _, _, C2 = coefs(2)
+    np.multiply(P1, bkp1, out=tmp)
+    np.multiply(bkp2, C2, out=bkp2)
+    np.add(bkp2, cs[0], out=bkp2)
+    return np.add(tmp, bkp2, out=tmp if out is None else out)
@@ -1,39 +1,118 @@
 """Tools for working with Q (Forbes) polynomials."""
 # not special engine, only concerns scalars here
 from collections import defaultdict
+from functools import lru_cache
+
+import numpy as truenp
+
 from scipy import special
 
-from .jacobi import jacobi, jacobi_sequence
+from .jacobi import jacobi, jacobi_sequence, jacobi_sum, _trim_zero_orders
 
 from prysm.mathops import np, kronecker, gamma, sign
 
+# 1/sqrt(19), the normalization of Q_1.  A python float and not a numpy scalar,
+# so that it does not promote float32 arrays to float64
+_INV_SQRT19 = 1 / 19 ** 0.5
+
+
+# g, h, f of oe-18-19-19700 tabulated for arguments 0..len-1, see _qbfs_ghf.
+# One table is shared by all orders and grown when a higher order is needed
+_QBFS_GHF = (truenp.empty(0), truenp.empty(0), truenp.empty(0))
+
+
+def _qbfs_ghf(n_max):
+    """Tables of g_qbfs, h_qbfs, f_qbfs for arguments 0..n_max.
+
+    The recurrences index these once per order, so the coefficients are
+    evaluated a single time instead of inside the loops.  A single table is
+    kept for the module; when n_max exceeds it, it is extended to at least
+    twice its length, continuing the forward pass from where it stopped.  The
+    tables are always host (numpy) arrays, so that reading an element does not
+    incur a device synchronization when the mathops engine is a GPU library.
+
+    Parameters
+    ----------
+    n_max : `int`
+        largest argument to tabulate
+
+    Returns
+    -------
+    `numpy.ndarray`, `numpy.ndarray`, `numpy.ndarray`
+        g, h, f; each of shape (n_max+1,).  Read-only views of the shared table
+
+    """
+    global _QBFS_GHF
+    g, h, f = _QBFS_GHF
+    start = g.size
+    if n_max >= start:
+        size = max(n_max + 1, 2 * start)
+        g = truenp.concatenate([g, truenp.empty(size - start)])
+        h = truenp.concatenate([h, truenp.empty(size - start)])
+        f = truenp.concatenate([f, truenp.empty(size - start)])
+        # g, h, f are mutually recursive, oe-18-19-19700 eqs. (A.14)-(A.16),
+        # but each only depends on lower orders, so they can be filled in
+        # order by a single forward pass; f(k) first, then g(k) and h(k)
+        for k in range(start, size):
+            if k == 0:
+                f[k] = 2
+            elif k == 1:
+                f[k] = truenp.sqrt(19) / 2
+            else:
+                f[k] = truenp.sqrt(k * (k + 1) + 3 - g[k-1] * g[k-1] - h[k-2] * h[k-2])
+
+            if k == 0:
+                g[k] = - 1 / 2
+            else:
+                g[k] = - (1 + g[k-1] * h[k-1]) / f[k]
+
+            n = k + 2
+            h[k] = -n * (n - 1) / (2 * f[k])
+
+        for arr in (g, h, f):
+            arr.setflags(write=False)
+
+        _QBFS_GHF = (g, h, f)
+
+    return g[:n_max+1], h[:n_max+1], f[:n_max+1]
+
 
 def g_qbfs(n_minus_1):
     """g(m-1) from oe-18-19-19700 eq. (A.15)."""
-    if n_minus_1 == 0:
-        return - 1 / 2
-    else:
-        n_minus_2 = n_minus_1 - 1
-        return - (1 + g_qbfs(n_minus_2) * h_qbfs(n_minus_2)) / f_qbfs(n_minus_1)
+    return _qbfs_ghf(n_minus_1)[0][n_minus_1]
 
 
 def h_qbfs(n_minus_2):
     """h(m-2) from oe-18-19-19700 eq. (A.14)."""
-    n = n_minus_2 + 2
-    return -n * (n - 1) / (2 * f_qbfs(n_minus_2))
+    return _qbfs_ghf(n_minus_2)[1][n_minus_2]
 
 
 def f_qbfs(n):
     """f(m) from oe-18-19-19700 eq. (A.16)."""
-    if n == 0:
-        return 2
-    elif n == 1:
-        return np.sqrt(19) / 2
-    else:
-        term1 = n * (n + 1) + 3
-        term2 = g_qbfs(n - 1) ** 2
-        term3 = h_qbfs(n - 2) ** 2
-        return np.sqrt(term1 - term2 - term3)
+    return _qbfs_ghf(n)[2][n]
+
+
+def _qbfs_step(c, g, h, f, Pnm2, Pnm1, Qnm2, Qnm1, tmp):
+    """Advance the Qbfs recurrence by one order, in-place.
+
+    P_n is written into the storage of Pnm2 and Q_n into the storage of Qnm2.
+    g, h, f are g_qbfs(n-1), h_qbfs(n-2), f_qbfs(n).  tmp is scratch space of
+    the same shape.  Returns (Pnm1, Pn); the caller is responsible for
+    rotating Qnm2, Qnm1 => Qnm1, Qn.
+
+    """
+    # P_n = c * P_n-1 - P_n-2
+    np.multiply(c, Pnm1, out=tmp)
+    np.subtract(tmp, Pnm2, out=Pnm2)
+    Pn = Pnm2
+
+    # Q_n = (P_n - g * Q_n-1 - h * Q_n-2) / f
+    np.multiply(Qnm2, -h, out=Qnm2)
+    np.multiply(Qnm1, g, out=tmp)
+    np.subtract(Qnm2, tmp, out=Qnm2)
+    np.add(Qnm2, Pn, out=Qnm2)
+    np.multiply(Qnm2, 1/f, out=Qnm2)  # small optimization; mul by 1/f instead of div by f
+    return Pnm1, Pn
 
 
 def Qbfs(n, x):
@@ -66,39 +145,41 @@ def Qbfs(n, x):
     # c_Q is the leading term used to convert Qm to Qbfs
     c_Q = rho * (1 - rho)
     if n == 0:
-        return np.ones_like(x) * c_Q
+        # Q_0 = 1, so Qbfs_0 is c_Q itself
+        return c_Q
 
     if n == 1:
-        return 1 / np.sqrt(19) * (13 - 16 * rho) * c_Q
+        return (13 - 16 * rho) * _INV_SQRT19 * c_Q
 
     # c is the leading term of the recurrence relation for P
     c = 2 - 4 * rho
     # P0, P1 are the first two terms of the recurrence relation for auxiliary
     # polynomial P_n
-    P0 = np.ones_like(x) * 2
-    P1 = 6 - 8 * rho
+    # the recurrence is written in-place, so every buffer is given storage
+    # of a floating dtype, even when x is a scalar or an integer array
+    dtype = np.result_type(rho, 1.0)
+    P0 = np.full(np.shape(rho), 2, dtype=dtype)
+    P1 = np.asarray(6 - 8 * rho, dtype=dtype)
     Pnm2 = P0
     Pnm1 = P1
 
     # Q0, Q1 are the first two terms of the recurrence relation for Qm
-    Q0 = np.ones_like(x)
-    Q1 = 1 / np.sqrt(19) * (13 - 16 * rho)
+    Q0 = np.ones(np.shape(rho), dtype=dtype)
+    Q1 = np.asarray((13 - 16 * rho) * _INV_SQRT19, dtype=dtype)
     Qnm2 = Q0
     Qnm1 = Q1
+    # the recurrence is done in-place; each new term is written over the
+    # storage of the term two orders back, which is no longer needed.  With
+    # the one scratch array, no temporaries are allocated inside the loop
+    tmp = np.empty_like(Q1)
+    # python floats, not numpy float64 scalars, which would promote the
+    # arithmetic on float32 buffers to float64
+    gs, hs, fs = (tbl.tolist() for tbl in _qbfs_ghf(n))
     for nn in range(2, n+1):
-        Pn = c * Pnm1 - Pnm2
-        Pnm2 = Pnm1
-        Pnm1 = Pn
-        g = g_qbfs(nn - 1)
-        h = h_qbfs(nn - 2)
-        f = f_qbfs(nn)
-        Qn = (Pn - g * Qnm1 - h * Qnm2) * (1/f)  # small optimization; mul by 1/f instead of div by f
-        Qnm2 = Qnm1
-        Qnm1 = Qn
+        Pnm2, Pnm1 = _qbfs_step(c, gs[nn-1], hs[nn-2], fs[nn], Pnm2, Pnm1, Qnm2, Qnm1, tmp)
+        Qnm2, Qnm1 = Qnm1, Qnm2
 
-    # Qn is certainly defined (flake8 can't tell the previous ifs bound the loop
-    # to always happen once)
-    return Qn * c_Q  # NOQA
+    return Qnm1 * c_Q
 
 
 def Qbfs_sequence(ns, x):
@@ -127,42 +208,129 @@ def Qbfs_sequence(ns, x):
     # c_Q is the leading term used to convert Qm to Qbfs
     c_Q = rho * (1 - rho)
     if ns[min_i] == 0:
-        yield np.ones_like(x) * c_Q
+        # Q_0 = 1, so Qbfs_0 is c_Q; copied since c_Q is used for later orders
+        yield np.array(c_Q)
         min_i += 1
 
+    if min_i == len(ns):
+        return
+
     if ns[min_i] == 1:
-        yield 1 / np.sqrt(19) * (13 - 16 * rho) * c_Q
+        yield (13 - 16 * rho) * _INV_SQRT19 * c_Q
         min_i += 1
 
+    if min_i == len(ns):
+        return
+
     # c is the leading term of the recurrence relation for P
     c = 2 - 4 * rho
     # P0, P1 are the first two terms of the recurrence relation for auxiliary
     # polynomial P_n
-    P0 = np.ones_like(x) * 2
-    P1 = 6 - 8 * rho
+    # the recurrence is written in-place, so every buffer is given storage
+    # of a floating dtype, even when x is a scalar or an integer array
+    dtype = np.result_type(rho, 1.0)
+    P0 = np.full(np.shape(rho), 2, dtype=dtype)
+    P1 = np.asarray(6 - 8 * rho, dtype=dtype)
     Pnm2 = P0
     Pnm1 = P1
 
     # Q0, Q1 are the first two terms of the recurrence relation for Qbfs_n
-    Q0 = np.ones_like(x)
-    Q1 = 1 / np.sqrt(19) * (13 - 16 * rho)
+    Q0 = np.ones(np.shape(rho), dtype=dtype)
+    Q1 = np.asarray((13 - 16 * rho) * _INV_SQRT19, dtype=dtype)
     Qnm2 = Q0
     Qnm1 = Q1
+    tmp = np.empty_like(Q1)
+    # python floats, not numpy float64 scalars, which would promote the
+    # arithmetic on float32 buffers to float64
+    gs, hs, fs = (tbl.tolist() for tbl in _qbfs_ghf(ns[-1]))
     for nn in range(2, ns[-1]+1):
-        Pn = c * Pnm1 - Pnm2
-        Pnm2 = Pnm1
-        Pnm1 = Pn
-        g = g_qbfs(nn - 1)
-        h = h_qbfs(nn - 2)
-        f = f_qbfs(nn)
-        Qn = (Pn - g * Qnm1 - h * Qnm2) * (1/f)  # small optimization; mul by 1/f instead of div by f
-        Qnm2 = Qnm1
-        Qnm1 = Qn
+        Pnm2, Pnm1 = _qbfs_step(c, gs[nn-1], hs[nn-2], fs[nn], Pnm2, Pnm1, Qnm2, Qnm1, tmp)
+        Qnm2, Qnm1 = Qnm1, Qnm2
         if ns[min_i] == nn:
-            yield Qn * c_Q
+            yield Qnm1 * c_Q
             min_i += 1
 
 
+def Qbfs_sum(cs, x, out=None):
+    """Weighted sum of Qbfs polynomials at point(s) x, using Clenshaw's method.
+
+    Parameters
+    ----------
+    cs : `numpy.ndarray`
+        coefficients, of shape (N+1,) or (N+1, ...); cs[n] is the weight of
+        Qbfs_n, for n = 0, 1, 2, ..., N.  Trailing dimensions hold independent
+        sets of coefficients, which are all summed in the same pass.  The
+        weights are used on the host; a device array is copied there once
+    x : `numpy.array`
+        point(s) at which to evaluate
+    out : `numpy.ndarray`, optional
+        array of shape cs.shape[1:] + x.shape to write the result into.  When
+        the sum is evaluated many times on the same grid, e.g. in an optimizer,
+        this avoids allocating a new array for each result
+
+    Returns
+    -------
+    `numpy.ndarray`
+        sum_n cs[n] * Qbfs_n(x), of shape cs.shape[1:] + x.shape
+
+    Notes
+    -----
+    No individual Qbfs polynomial is formed.  The weights of Q_n are first
+    converted to weights of the auxiliary polynomials P_n, which is a scalar
+    back-substitution through P_n = f_n Q_n + g_n-1 Q_n-1 + h_n-2 Q_n-2.
+    The P_n series is then summed in a single downward pass with Clenshaw's
+    recurrence, following the appendix of oe-18-19-19700.  This is faster than
+    summing the output of Qbfs_sequence when there are many terms.
+
+    """
+    # the conversion of weights is a short scalar loop, it is done on the host
+    # and only the result is sent to the engine.  Orders above the last nonzero
+    # weight contribute nothing and are dropped
+    cs, _ = _trim_zero_orders(cs)
+    N = cs.shape[0] - 1
+
+    # ds are the weights of P_n; two trailing zeros terminate the recurrence
+    ds = truenp.zeros((N + 3,) + cs.shape[1:], dtype=truenp.result_type(cs, float))
+    gs, hs, fs = _qbfs_ghf(N)
+    for n in range(N, -1, -1):
+        ds[n] = (cs[n] - gs[n] * ds[n+1] - hs[n] * ds[n+2]) / fs[n]
+
+    x = np.asarray(x)
+    rho = x ** 2
+    # c_Q is the leading term used to convert Qm to Qbfs
+    c_Q = rho * (1 - rho)
+    # alpha is the leading term of the recurrence relation for P,
+    # P_n+1 = alpha * P_n - P_n-1
+    alpha = 2 - 4 * rho
+
+    # the buffers are floating even when x is an integer array, and complex
+    # for complex weights, as summing Qbfs_sequence would be.  The weights are
+    # sent in the same dtype, so float32 grids are not promoted by them
+    dtype = np.result_type(x, 1j if truenp.iscomplexobj(cs) else 1.0)
+
+    # each set of weights broadcasts against x
+    shape = cs.shape[1:] + np.shape(c_Q)
+    ds = np.asarray(ds.reshape(ds.shape + (1,) * np.ndim(c_Q)), dtype=dtype)
+
+    # Clenshaw: b_n = d_n + alpha * b_n+1 - b_n+2, in-place over two buffers
+    bnp1 = np.zeros(shape, dtype=dtype)
+    bnp2 = np.zeros(shape, dtype=dtype)
+    tmp = np.empty(shape, dtype=dtype)
+    for n in range(N, 0, -1):
+        np.multiply(alpha, bnp1, out=tmp)
+        np.subtract(tmp, bnp2, out=bnp2)
+        np.add(bnp2, ds[n], out=bnp2)
+        bnp1, bnp2 = bnp2, bnp1
+
+    # S = d_0 P_0 + b_1 P_1 - b_2 P_0, with P_0 = 2, P_1 = 6 - 8 rho
+    P1 = 6 - 8 * rho
+    np.multiply(P1, bnp1, out=tmp)
+    np.subtract(bnp2, ds[0], out=bnp2)
+    np.multiply(bnp2, 2, out=bnp2)
+    np.subtract(tmp, bnp2, out=tmp)
+    return np.multiply(tmp, c_Q, out=out)
+
+
 def Qcon(n, x):
     """Qcon polynomial of order n at point(s) x.
 
@@ -220,6 +388,42 @@ def Qcon_sequence(ns, x):
         yield Pn * x4
 
 
+def Qcon_sum(cs, x, out=None):
+    """Weighted sum of Qcon polynomials at point(s) x, using Clenshaw's method.
+
+    Parameters
+    ----------
+    cs : `numpy.ndarray`
+        coefficients, of shape (N+1,) or (N+1, ...); cs[n] is the weight of
+        Qcon_n, for n = 0, 1, 2, ..., N.  Trailing dimensions hold independent
+        sets of coefficients, which are all summed in the same pass.  The
+        weights are used on the host; a device array is copied there once
+    x : `numpy.array`
+        point(s) at which to evaluate
+    out : `numpy.ndarray`, optional
+        array of shape cs.shape[1:] + x.shape to write the result into
+
+    Returns
+    -------
+    `numpy.ndarray`
+        sum_n cs[n] * Qcon_n(x), of shape cs.shape[1:] + x.shape
+
+    Notes
+    -----
+    The sum of the jacobi polynomials is computed before the multiplication
+    by x^4 (see Qcon), so no individual Qcon polynomial is formed.
+
+    """
+    x = np.asarray(x)
+    xx = x ** 2
+    xx = 2 * xx - 1
+    # x^4 is formed before the sum is written, since out may be x itself
+    x4 = x ** 4
+    Psum = jacobi_sum(cs, 0, 4, xx, out=out)
+    return np.multiply(Psum, x4, out=Psum)
+
+
+@lru_cache(4000)
 def abc_q2d(n, m):
     """A, B, C terms for 2D-Q polynomials.  oe-20-3-2483 Eq. (A.3).
 
@@ -236,21 +440,28 @@ def abc_q2d(n, m):
         A, B, C
 
     """
+    # the factors (m + 2n - k) appear in every term, compute them once
+    mp2n = m + 2 * n
+    mp2nm1 = mp2n - 1
+    mp2nm2 = mp2n - 2
+    mp2nm3 = mp2n - 3
+    tnm1 = 2 * n - 1
     # D is used everywhere
-    D = (4 * n ** 2 - 1) * (m + n - 2) * (m + 2 * n - 3)
+    D = (4 * n * n - 1) * (m + n - 2) * mp2nm3
+    invD = 1 / D  # small optimization; mul by 1/D instead of div by D, three times
 
     # A
-    term1 = (2 * n - 1) * (m + 2 * n - 2)
+    term1 = tnm1 * mp2nm2
     term2 = (4 * n * (m + n - 2) + (m - 3) * (2 * m - 1))
-    A = (term1 * term2) / D
+    A = (term1 * term2) * invD
 
     # B
-    num = -2 * (2 * n - 1) * (m + 2 * n - 3) * (m + 2 * n - 2) * (m + 2 * n - 1)
-    B = num / D
+    num = -2 * tnm1 * mp2nm3 * mp2nm2 * mp2nm1
+    B = num * invD
 
     # C
-    num = n * (2 * n - 3) * (m + 2 * n - 1) * (2 * m + 2 * n - 3)
-    C = num / D
+    num = n * (2 * n - 3) * mp2nm1 * (2 * m + 2 * n - 3)
+    C = num * invD
 
     return A, B, C
 
@@ -276,8 +487,9 @@ def G_q2d(n, m):
         den = 2 ** (m + 1) * special.factorial(m - 1)
         return num / den
     elif n > 0 and m == 1:
-        t1num = (2 * n ** 2 - 1) * (n ** 2 - 1)
-        t1den = 8 * (4 * n ** 2 - 1)
+        nsq = n * n
+        t1num = (2 * nsq - 1) * (nsq - 1)
+        t1den = 8 * (4 * nsq - 1)
         term1 = -t1num / t1den
         term2 = 1 / 24 * kronecker(n, 1)
         return term1 - term2
@@ -311,29 +523,34 @@ def F_q2d(n, m):
 
     """
     if n == 0:
-        num = m ** 2 * special.factorial2(2 * m - 3)
+        num = m * m * special.factorial2(2 * m - 3)
         den = 2 ** (m + 1) * special.factorial(m - 1)
         return num / den
     elif n > 0 and m == 1:
-        t1num = 4 * (n - 1) ** 2 * n ** 2 + 1
-        t1den = 8 * (2 * n - 1) ** 2
+        nnm1 = n * (n - 1)
+        tnm1 = 2 * n - 1
+        t1num = 4 * nnm1 * nnm1 + 1
+        t1den = 8 * tnm1 * tnm1
         term1 = t1num / t1den
         term2 = 11 / 32 * kronecker(n, 1)
         return term1 + term2
     else:
         Chi = m + n - 2
-        nt1 = 2 * n * Chi * (3 - 5 * m + 4 * n * Chi)
-        nt2 = m ** 2 * (3 - m + 4 * n * Chi)
+        fnChi = 4 * n * Chi
+        nt1 = 2 * n * Chi * (3 - 5 * m + fnChi)
+        nt2 = m * m * (3 - m + fnChi)
         num = nt1 + nt2
 
-        dt1 = (m + 2 * n - 3) * (m + 2 * n - 2)
-        dt2 = (m + 2 * n - 1) * (2 * n - 1)
+        mp2n = m + 2 * n
+        dt1 = (mp2n - 3) * (mp2n - 2)
+        dt2 = (mp2n - 1) * (2 * n - 1)
         den = dt1 * dt2
 
         term1 = num / den
         return term1 * gamma(n, m)
 
 
+@lru_cache(4000)
 def g_q2d(n, m):
     """Lowercase g term for 2D-Q polynomials.  oe-20-3-2483 Eq. (A.18a).
 
@@ -353,6 +570,7 @@ def g_q2d(n, m):
     return G_q2d(n, m) / f_q2d(n, m)
 
 
+@lru_cache(4000)
 def f_q2d(n, m):
     """Lowercase f term for 2D-Q polynomials.  oe-20-3-2483 Eq. (A.18b).
 
@@ -375,26 +593,23 @@ def f_q2d(n, m):
         return np.sqrt(F_q2d(n, m) - g_q2d(n-1, m) ** 2)
 
 
-def Q2d(n, m, r, t):
-    """2D Q polynomial, aka the Forbes polynomials.
+def _q2d_radial_sequence(ns, m, x):
+    """Radial part of the 2D-Q polynomials of orders ns and azimuthal order m.
 
     Parameters
     ----------
-    n : `int`
-        radial polynomial order
+    ns : `Iterable` of `int`
+        sorted radial polynomial orders
     m : `int`
-        azimuthal polynomial order
-    r : `numpy.ndarray`
-        radial coordinate, slope orthogonal in [0,1]
-    t : `numpy.ndarray`
-        azimuthal coordinate, radians
+        azimuthal polynomial order, m > 0
+    x : `numpy.ndarray`
+        the squared radial coordinate, u^2
 
     Returns
     -------
-    `numpy.ndarray`
-        array containing Q2d_n^m(r,t)
-        the leading coefficient u^m or u^2 (1 - u^2) and sines/cosines
-        are included in the return
+    generator of `numpy.ndarray`
+        yielding Q_n^m(x) for each n in ns; the u^m prefix and sines/cosines
+        are not included
 
     """
     # Q polynomials have auxiliary polynomials "P"
@@ -407,42 +622,35 @@ def Q2d(n, m, r, t):
     # a single value of m, and the 'seed' depends on both m and n.
     #
     # in general, Q_n^m = [P_n^m(x) - g_n-1^m Q_n-1^m] / f_n^m
-
-    # for the sake of consistency, this function takes args of (r,t)
-    # but the papers define an argument of u (really, u^2...)
-    # which is what I call rho (or r).
-    # for the sake of consistency of impl, I alias r=>u
-    # and compute x = u**2 to match the papers
-    u = r
-    x = u ** 2
-    if m == 0:
-        return Qbfs(n, r)
-
-    # m == 0 already was short circuited, so we only
-    # need to consider the m =/= 0 case for azimuthal terms
-    if sign(m) == -1:
-        m = abs(m)
-        prefix = u ** m * np.sin(m*t)
-    else:
-        prefix = u ** m * np.cos(m*t)
-        m = abs(m)
+    ns = list(ns)
+    min_i = 0
+    N = ns[-1]
 
     P0 = 1/2
-    if m == 1 and n == 1:
+    if m == 1 and N == 1:
         P1 = 1 - x/2
     else:
         P1 = (m - .5) + (1 - m) * x
 
     f0 = f_q2d(0, m)
     Q0 = 1 / (2 * f0)
-    if n == 0:
-        return Q0 * prefix
+    if ns[min_i] == 0:
+        yield Q0
+        min_i += 1
+
+    if min_i == len(ns):
+        return
 
     g0 = g_q2d(0, m)
     f1 = f_q2d(1, m)
     Q1 = (P1 - g0 * Q0) * (1/f1)
-    if n == 1:
-        return Q1 * prefix
+    if ns[min_i] == 1:
+        yield Q1
+        min_i += 1
+
+    if min_i == len(ns):
+        return
+
     # everything above here works, or at least everything in the returns works
     if m == 1:
         P2 = (3 - x * (12 - 8 * x)) / 6
@@ -456,10 +664,19 @@ def Q2d(n, m, r, t):
         f3 = f_q2d(3, m)
         Q3 = (P3 - g2 * Q2) * (1/f3)
         # Q2, Q3 correct
-        if n == 2:
-            return Q2 * prefix
-        elif n == 3:
-            return Q3 * prefix
+        if ns[min_i] == 2:
+            yield Q2
+            min_i += 1
+
+        if min_i == len(ns):
+            return
+
+        if ns[min_i] == 3:
+            yield Q3
+            min_i += 1
+
+        if min_i == len(ns):
+            return
 
         Pnm2, Pnm1 = P2, P3
         Qnm1 = Q3
@@ -469,20 +686,85 @@ def Q2d(n, m, r, t):
         Qnm1 = Q1
         min_n = 2
 
-    for nn in range(min_n, n+1):
+    # the recurrence is done in-place; P rotates through three buffers and Q_n
+    # is written over Q_n-1, unless Q_n-1 was yielded, so no temporaries are
+    # allocated inside the loop.  P0 may be a scalar, it is given its own storage
+    Qnm1_yielded = min_i > 0 and ns[min_i-1] == min_n - 1
+    Qnm1 = np.asarray(Qnm1)
+    Pnm2 = np.array(np.broadcast_to(Pnm2, Qnm1.shape), dtype=Qnm1.dtype)
+    Pnm1 = np.asarray(Pnm1, dtype=Qnm1.dtype)
+    Pn = np.empty_like(Qnm1)
+    tmp = np.empty_like(Qnm1)
+    for nn in range(min_n, N+1):
+        # Pn = (A + B * x) * Pnm1 - C * Pnm2
         A, B, C = abc_q2d(nn-1, m)
-        Pn = (A + B * x) * Pnm1 - C * Pnm2
+        np.multiply(x, B, out=tmp)
+        np.add(tmp, A, out=tmp)
+        np.multiply(tmp, Pnm1, out=tmp)
+        np.multiply(Pnm2, C, out=Pn)
+        np.subtract(tmp, Pn, out=Pn)
 
+        # Qn = (Pn - gnm1 * Qnm1) / fn
         gnm1 = g_q2d(nn-1, m)
         fn = f_q2d(nn, m)
-        Qn = (Pn - gnm1 * Qnm1) * (1/fn)
+        Qn = np.empty_like(Qnm1) if Qnm1_yielded else Qnm1
+        np.multiply(Qnm1, gnm1, out=Qn)
+        np.subtract(Pn, Qn, out=Qn)
+        np.multiply(Qn, 1/fn, out=Qn)
 
-        Pnm2, Pnm1 = Pnm1, Pn
+        Pnm2, Pnm1, Pn = Pnm1, Pn, Pnm2
         Qnm1 = Qn
+        Qnm1_yielded = ns[min_i] == nn
+        if Qnm1_yielded:
+            yield Qn
+            min_i += 1
 
-    # flake8 can't prove that the branches above the loop guarantee that we
-    # enter the loop and Qn is defined
-    return Qn * prefix  # NOQA
+
+def Q2d(n, m, r, t):
+    """2D Q polynomial, aka the Forbes polynomials.
+
+    Parameters
+    ----------
+    n : `int`
+        radial polynomial order
+    m : `int`
+        azimuthal polynomial order
+    r : `numpy.ndarray`
+        radial coordinate, slope orthogonal in [0,1]
+    t : `numpy.ndarray`
+        azimuthal coordinate, radians
+
+    Returns
+    -------
+    `numpy.ndarray`
+        array containing Q2d_n^m(r,t)
+        the leading coefficient u^m or u^2 (1 - u^2) and sines/cosines
+        are included in the return
+
+    """
+    # the recurrence itself is in _q2d_radial_sequence
+
+    # for the sake of consistency, this function takes args of (r,t)
+    # but the papers define an argument of u (really, u^2...)
+    # which is what I call rho (or r).
+    # for the sake of consistency of impl, I alias r=>u
+    # and compute x = u**2 to match the papers
+    u = r
+    x = u ** 2
+    if m == 0:
+        return Qbfs(n, r)
+
+    # m == 0 already was short circuited, so we only
+    # need to consider the m =/= 0 case for azimuthal terms
+    if sign(m) == -1:
+        m = abs(m)
+        prefix = u ** m * np.sin(m*t)
+    else:
+        prefix = u ** m * np.cos(m*t)
+        m = abs(m)
+
+    Qn = next(_q2d_radial_sequence([n], m, x))
+    return Qn * prefix
 
 
 def Q2d_sequence(nms, r, t):
@@ -504,25 +786,21 @@ def Q2d_sequence(nms, r, t):
 
     """
     # see Q2d for general sense of this algorithm.
-    # the way this one works is to compute the maximum N for each |m|, and then
-    # compute the recurrence for each of those sequences and storing it.  A loop
-    # is then iterated over the input nms, and selected value with appropriate
-    # prefixes / other terms yielded.
+    # the way this one works is to collect the requested orders n for each |m|,
+    # and then run the recurrence for each of those sequences once, storing
+    # only the requested orders.  A loop is then iterated over the input nms,
+    # and selected value with appropriate prefixes / other terms yielded.
 
     u = r
     x = u ** 2
 
-    def factory():
-        return 0
-
-    # maps |m| => N
+    # maps |m| => {n}
     m_has_pos = set()
     m_has_neg = set()
-    max_ns = defaultdict(factory)
+    requested_ns = defaultdict(set)
     for n, m in nms:
         m_ = abs(m)
-        if max_ns[m_] < n:
-            max_ns[m_] = n
+        requested_ns[m_].add(n)
         if m > 0:
             m_has_pos.add(m_)
         else:
@@ -533,7 +811,7 @@ def Q2d_sequence(nms, r, t):
     sin_scales = {}
     cos_scales = {}
 
-    for absm in max_ns.keys():
+    for absm in requested_ns.keys():
         u_scales[absm] = u ** absm
         if absm in m_has_neg:
             sin_scales[absm] = np.sin(absm * t)
@@ -541,65 +819,14 @@ def Q2d_sequence(nms, r, t):
             cos_scales[absm] = np.cos(absm * t)
 
     sequences = {}
-    for m, N in max_ns.items():
+    for m, ns in requested_ns.items():
+        ns = sorted(ns)
         if m == 0:
-            sequences[m] = list(Qbfs_sequence(range(N+1), r))
+            seq = Qbfs_sequence(ns, r)
         else:
-            sequences[m] = []
-            P0 = 1/2
-            if m == 1 and N == 1:
-                P1 = 1 - x/2
-            else:
-                P1 = (m - .5) + (1 - m) * x
-
-            f0 = f_q2d(0, m)
-            Q0 = 1 / (2 * f0)
-            sequences[m].append(Q0)
-            if N == 0:
-                continue
-
-            g0 = g_q2d(0, m)
-            f1 = f_q2d(1, m)
-            Q1 = (P1 - g0 * Q0) * (1/f1)
-            sequences[m].append(Q1)
-            if N == 1:
-                continue
-            # everything above here works, or at least everything in the returns works
-            if m == 1:
-                P2 = (3 - x * (12 - 8 * x)) / 6
-                P3 = (5 - x * (60 - x * (120 - 64 * x))) / 10
-
-                g1 = g_q2d(1, m)
-                f2 = f_q2d(2, m)
-                Q2 = (P2 - g1 * Q1) * (1/f2)
-
-                g2 = g_q2d(2, m)
-                f3 = f_q2d(3, m)
-                Q3 = (P3 - g2 * Q2) * (1/f3)
-                sequences[m].append(Q2)
-                sequences[m].append(Q3)
-                # Q2, Q3 correct
-                if N <= 3:
-                    continue
-                Pnm2, Pnm1 = P2, P3
-                Qnm1 = Q3
-                min_n = 4
-            else:
-                Pnm2, Pnm1 = P0, P1
-                Qnm1 = Q1
-                min_n = 2
-
-            for nn in range(min_n, N+1):
-                A, B, C = abc_q2d(nn-1, m)
-                Pn = (A + B * x) * Pnm1 - C * Pnm2
-
-                gnm1 = g_q2d(nn-1, m)
-                fn = f_q2d(nn, m)
-                Qn = (Pn - gnm1 * Qnm1) * (1/fn)
-                sequences[m].append(Qn)
+            seq = _q2d_radial_sequence(ns, m, x)
 
-                Pnm2, Pnm1 = Pnm1, Pn
-                Qnm1 = Qn
+        sequences[m] = dict(zip(ns, seq))
 
     for n, m in nms:
         if m != 0:
@@ -97,28 +97,21 @@ def zernike_nm_sequence(nms, r, t, norm=True):
     am = truenp.abs(ms)
     amu = truenp.unique(am)
 
-    def factory():
-        return 0
-
-    jacobi_sequences_mjn = defaultdict(factory)
-    # jacobi_sequences_mjn is a lookup table from |m| to all orders < max(n_j)
-    # for each |m|, i.e. 0 .. n_j_max
+    jacobi_sequences_mjn = defaultdict(set)
+    # jacobi_sequences_mjn is a lookup table from |m| to the jacobi orders
+    # needed for that |m|.  Only those orders are kept, the intermediate
+    # orders of the recurrence are not, which bounds memory use for high order
+    # sets of polynomials by the number of polynomials requested
     for nm, am_ in zip(nms, am):
         n = nm[0]
         nj = (n-am_) // 2
-        if nj > jacobi_sequences_mjn[am_]:
-            jacobi_sequences_mjn[am_] = nj
-
-    for k in jacobi_sequences_mjn:
-        nj = jacobi_sequences_mjn[k]
-        jacobi_sequences_mjn[k] = truenp.arange(nj+1)
+        jacobi_sequences_mjn[am_].add(nj)
 
     jacobi_sequences = {}
 
-    jacobi_sequences_mjn = dict(jacobi_sequences_mjn)
     for k in jacobi_sequences_mjn:
-        n_jac = jacobi_sequences_mjn[k]
-        jacobi_sequences[k] = list(jacobi_sequence(n_jac, 0, k, x))
+        n_jac = sorted(jacobi_sequences_mjn[k])
+        jacobi_sequences[k] = dict(zip(n_jac, jacobi_sequence(n_jac, 0, k, x)))
 
     powers_of_m = {}
     sines = {}
@@ -29,3 +29,15 @@ def test_mtp_reverses_self(samples):
 def test_mtp_cache_empty_zeros_nbytes():
     fttools.mdft.clear()
     assert fttools.mdft.nbytes() == 0
+
+
+def test_mtp_cache_nbytes_matches_cached_arrays():
+    fttools.mdft.clear()
+    inp = np.random.rand(32, 32)
+    fttools.mdft.dft2(inp, 1, 64)
+    fttools.mdft.dft2(inp, 2, 48)
+    total = 0
+    for dict_ in (fttools.mdft.Ein_fwd, fttools.mdft.Eout_fwd, fttools.mdft.Ein_rev, fttools.mdft.Eout_rev):
+        total += sum(v.nbytes for v in dict_.values())
+
+    assert fttools.mdft.nbytes() == total
@@ -47,6 +47,142 @@ def test_qbfs_sequence_functions(rho):
     assert len(list(gen)) == len(ns)
 
 
+def test_qbfs_coef_tables_grow_consistently():
+    from prysm.polynomials.qpoly import _qbfs_ghf
+    small = [arr.copy() for arr in _qbfs_ghf(3)]
+    big = _qbfs_ghf(50)
+    for s, b in zip(small, big):
+        assert b.shape == (51,)
+        assert not b.flags.writeable
+        assert np.array_equal(s, b[:4])
+    assert polynomials.qpoly.f_qbfs(50) == big[2][50]
+
+
+@pytest.mark.parametrize('x', [0.5, np.array([0, 1])])
+def test_qbfs_scalar_and_integer_x(x):
+    expected = polynomials.Qbfs(4, np.asarray(x, dtype=float))
+    assert np.allclose(polynomials.Qbfs(4, x), expected)
+    assert np.allclose(list(polynomials.Qbfs_sequence([2, 4], x))[-1], expected)
+
+
+@pytest.mark.parametrize('N', [0, 1, 2, 7])
+def test_qbfs_sum_matches_sequence(N, rho):
+    cs = np.arange(1, N+2) / (N+1)
+    modes = polynomials.Qbfs_sequence(range(N+1), rho)
+    expected = sum(c * mode for c, mode in zip(cs, modes))
+    assert np.allclose(polynomials.Qbfs_sum(cs, rho), expected)
+
+
+@pytest.mark.parametrize('x', [0.5, [0.25, 0.5], np.array([0, 1])])
+def test_qbfs_sum_scalar_and_integer_x(x):
+    cs = [1, 2, 3]
+    expected = sum(c * polynomials.Qbfs(n, np.asarray(x, dtype=float)) for n, c in enumerate(cs))
+    assert np.allclose(polynomials.Qbfs_sum(cs, x), expected)
+
+
+def test_qbfs_sum_complex_weights(rho):
+    cs = np.array([1+2j, 0.5, -1j, 3])
+    modes = polynomials.Qbfs_sequence(range(4), rho)
+    expected = sum(c * mode for c, mode in zip(cs, modes))
+    assert np.allclose(polynomials.Qbfs_sum(cs, rho), expected)
+
+
+@pytest.mark.parametrize('func', [polynomials.Qbfs_sum, polynomials.Qcon_sum])
+def test_qpoly_sum_writes_into_out(func, rho):
+    cs = [1, 2, 3, 4]
+    out = np.empty_like(rho)
+    res = func(cs, rho, out=out)
+    assert res is out
+    assert np.allclose(out, func(cs, rho))
+
+
+@pytest.mark.parametrize('func', [
+    polynomials.Qbfs_sum,
+    polynomials.Qcon_sum,
+    lambda cs, x, out=None: polynomials.jacobi_sum(cs, 1, 2, x, out=out),
+])
+def test_qpoly_sum_out_may_alias_x(func, rho):
+    cs = [1, 2, 3, 4]
+    expected = func(cs, rho)
+    x = rho.copy()
+    res = func(cs, x, out=x)
+    assert res is x
+    assert np.allclose(x, expected)
+
+
+@pytest.mark.parametrize('func', [polynomials.Qbfs_sum, polynomials.Qcon_sum])
+def test_qpoly_sum_ignores_zero_weights(func, rho):
+    cs = [0, 1, 0, 0, 2, 0, 0]
+    expected = func([0, 1, 0, 0, 2], rho)
+    assert np.allclose(func(cs, rho), expected)
+    assert np.allclose(func([0, 0, 0], rho), 0)
+    assert np.allclose(func([], rho), 0)
+
+
+class _DeviceArray:
+    """Stand-in for a GPU array, which can only be moved to the host by get."""
+
+    def __init__(self, data):
+        self._data = np.asarray(data)
+
+    def get(self):
+        return self._data
+
+    def __array__(self, *args, **kwargs):
+        raise TypeError('implicit conversion to a numpy array is not allowed')
+
+
+@pytest.mark.parametrize('func', [polynomials.Qbfs_sum, polynomials.Qcon_sum])
+def test_qpoly_sum_accepts_device_coefs(func, rho):
+    cs = [1, 2, 3, 4]
+    assert np.allclose(func(_DeviceArray(cs), rho), func(cs, rho))
+
+
+@pytest.mark.parametrize('func', [polynomials.Qbfs_sum, polynomials.Qcon_sum])
+def test_qpoly_sum_batched_coefs_match_individual(func, rho):
+    cs = np.arange(24).reshape(6, 2, 2) / 24
+    batch = func(cs, rho)
+    assert batch.shape == (2, 2) + rho.shape
+    for i in range(2):
+        for j in range(2):
+            assert np.allclose(batch[i, j], func(cs[:, i, j], rho))
+
+
+def test_qpoly_sum_on_unique_radii_matches_grid(rho):
+    cs = [1, 2, 3, 4]
+    r_unique, inverse = polynomials.unique_radii(rho)
+    assert r_unique.size < rho.size
+    assert np.allclose(polynomials.Qbfs_sum(cs, r_unique)[inverse], polynomials.Qbfs_sum(cs, rho))
+
+
+@pytest.mark.parametrize('func', [
+    lambda x: polynomials.Qbfs(5, x),
+    lambda x: list(polynomials.Qbfs_sequence([1, 4, 5], x))[-1],
+    lambda x: polynomials.Qbfs_sum([1, 2, 3, 4], x),
+    lambda x: polynomials.Qcon(5, x),
+    lambda x: polynomials.Qcon_sum([1, 2, 3, 4], x),
+])
+def test_qpoly_preserve_float32(func, rho):
+    rho = rho.astype(np.float32)
+    assert func(rho).dtype == np.float32
+
+
+def test_qbfs_recurrence_coefs_are_python_floats(rho, monkeypatch):
+    # numpy float64 scalars would run the float32 recurrence in float64
+    from prysm.polynomials import qpoly
+    seen = []
+    step = qpoly._qbfs_step
+
+    def spy(c, g, h, f, *args):
+        seen.extend((g, h, f))
+        return step(c, g, h, f, *args)
+
+    monkeypatch.setattr(qpoly, '_qbfs_step', spy)
+    polynomials.Qbfs(5, rho.astype(np.float32))
+    list(polynomials.Qbfs_sequence([5], rho.astype(np.float32)))
+    assert seen and all(type(v) is float for v in seen)
+
+
 @pytest.mark.parametrize('n', [0, 1, 2, 3, 4, 5, 6])
 def test_qcon_functions(n, rho):
     sag = polynomials.Qcon(n, rho)
@@ -58,6 +194,21 @@ def test_qcon_sequence_functions(rho):
     gen = polynomials.Qcon_sequence(ns, rho)
     assert len(list(gen)) == len(ns)
 
+
+@pytest.mark.parametrize('N', [0, 1, 2, 7])
+def test_qcon_sum_matches_sequence(N, rho):
+    cs = np.arange(1, N+2) / (N+1)
+    modes = polynomials.Qcon_sequence(range(N+1), rho)
+    expected = sum(c * mode for c, mode in zip(cs, modes))
+    assert np.allclose(polynomials.Qcon_sum(cs, rho), expected)
+
+
+@pytest.mark.parametrize('x', [0.5, [0.25, 0.5], np.array([0, 1])])
+def test_qcon_sum_scalar_and_integer_x(x):
+    cs = [1, 2, 3]
+    expected = sum(c * polynomials.Qcon(n, np.asarray(x, dtype=float)) for n, c in enumerate(cs))
+    assert np.allclose(polynomials.Qcon_sum(cs, x), expected)
+
 # there are truth tables in the paper, which are not used here.  Some of them contain
 # typos, so the test would have to be very loose, e.g. 0.05 atol.  A visual check
 # is equally valuable, so we only check functionality here.
@@ -83,6 +234,13 @@ def test_2d_Q_sequence_functions(rho, phi):
     assert len(modes) == len(nms)
 
 
+def test_2d_Q_sequence_sparse_orders_match_Q2d(rho, phi):
+    nms = [(0, 0), (4, 0), (2, 2), (5, -2), (3, 3)]
+    modes = list(polynomials.Q2d_sequence(nms, rho, phi))
+    for nm, mode in zip(nms, modes):
+        assert np.allclose(mode, polynomials.Q2d(*nm, rho, phi))
+
+
 # - zernike
 
 
@@ -207,6 +365,32 @@ def test_jacobi_1_4_match_scipy(n, alpha, beta):
     assert np.allclose(prysm_, scipy_)
 
 
+@pytest.mark.parametrize('n', [1, 2, 3, 6])
+def test_jacobi_scalar_x_gives_scalar(n):
+    prysm_ = polynomials.jacobi(n=n, alpha=1, beta=2, x=0.3)
+    assert np.ndim(prysm_) == 0 and not isinstance(prysm_, np.ndarray)
+    assert np.isclose(prysm_, sps_jac(n=n, alpha=1, beta=2)(0.3))
+
+
+@pytest.mark.parametrize('N', [0, 1, 2, 6])
+@pytest.mark.parametrize('alpha, beta', [
+    (0, 0),
+    (0, 4),
+    (-0.75, 0)])
+def test_jacobi_sum_matches_scipy(N, alpha, beta):
+    cs = np.arange(1, N+2) / (N+1)
+    prysm_ = polynomials.jacobi_sum(cs, alpha, beta, X)
+    scipy_ = sum(c * sps_jac(n=n, alpha=alpha, beta=beta)(X) for n, c in enumerate(cs))
+    assert np.allclose(prysm_, scipy_)
+
+
+@pytest.mark.parametrize('x', [0.5, [0.25, 0.5], np.array([0, 1])])
+def test_jacobi_sum_scalar_and_integer_x(x):
+    cs = [1, 2, 3]
+    scipy_ = sum(c * sps_jac(n=n, alpha=1, beta=2)(x) for n, c in enumerate(cs))
+    assert np.allclose(polynomials.jacobi_sum(cs, 1, 2, x), scipy_)
+
+
 def test_jacobi_weight_correct():
     from prysm.polynomials.jacobi import weight
     # these are cheby1 weights
@@ -285,6 +469,14 @@ def test_sum_and_lstsq():
     assert np.allclose(coefs, exp)
 
 
+def test_sum_of_xy_modes_preserves_float32():
+    x, y = make_xy_grid(16, diameter=2)
+    x, y = x.astype(np.float32), y.astype(np.float32)
+    mx, my = polynomials.separable_2d_sequence([0, 1, 2], [0, 1, 2], x, y, polynomials.cheby1_sequence)
+    assert polynomials.sum_of_xy_modes(mx, my, x, y).dtype == np.float32
+    assert polynomials.sum_of_xy_modes(mx, my, x, y, [0.5, 1, 2], [1, 2, 3]).dtype == np.float32
+
+
 @pytest.mark.parametrize(['a', 'b', 'c'], [
     [1, 1, 1],
     [1, 3, 1],